@@ -19,8 +19,11 @@ class OpenAIModule(AIInterface):
         self.blueprint.route("/ask", methods=["GET"])(self.show_form)
 
     def generate_text(self):
+        user_input = request.form.get("user_input", "").strip()
+        if not user_input:
+            return jsonify({"error": "user_input is required"}), 400
+
         try:
-            user_input = request.form["user_input"]
             logger.debug(f"User Input: {user_input}")
 
             response = openai.chat.completions.create(
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
 
 from virtual_assistant.database.database import Database
 
@@ -10,6 +10,11 @@ class CalendarAccount(Database.Model):
     provider = Column(String(50), nullable=False)
     authentication_credentials = Column(String, nullable=False, json=True)
 
+    # Accounts are always looked up by owner and calendar email
+    __table_args__ = (
+        Index("ix_calendar_account_user_id_email_address", "user_id", "email_address"),
+    )
+
     def __init__(self, user_id, email_address, provider, credentials):
         self.user_id = user_id
         self.email_address = email_address
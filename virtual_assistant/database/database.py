@@ -1,8 +1,22 @@
 # db_setup.py
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, inspect
 from sqlalchemy.sql import text
 
 from virtual_assistant.utils.logger import logger
+from virtual_assistant.utils.settings import Settings
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply the configured SQLite pragmas to each new connection."""
+    cursor = dbapi_connection.cursor()
+    if Settings.SQLITE_JOURNAL_MODE:
+        cursor.execute(f"PRAGMA journal_mode={Settings.SQLITE_JOURNAL_MODE}")
+    # synchronous only lasts for this connection, so unlike journal_mode it
+    # doesn't change the database file
+    if Settings.SQLITE_SYNCHRONOUS:
+        cursor.execute(f"PRAGMA synchronous={Settings.SQLITE_SYNCHRONOUS}")
+    cursor.close()
 
 
 class Database:
@@ -40,6 +54,21 @@ class Database:
     def init_app(app):
         database = Database.get_instance()  # Use the existing instance
         database._db.init_app(app)
+        with app.app_context():
+            engine = database._db.engine
+            if engine.dialect.name == "sqlite":
+                event.listen(engine, "connect", _set_sqlite_pragmas)
+            # Nothing runs create_all or migrations, so add the lookup index to
+            # existing databases here
+            if inspect(engine).has_table("calendar_account"):
+                with engine.begin() as connection:
+                    connection.execute(
+                        text(
+                            "CREATE INDEX IF NOT EXISTS "
+                            "ix_calendar_account_user_id_email_address "
+                            "ON calendar_account (user_id, email_address)"
+                        )
+                    )
 
     def add(self, model):
         self._db.session.add(model)
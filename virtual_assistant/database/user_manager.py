@@ -1,5 +1,6 @@
 import json
 import os
+import time
 
 from flask_login import current_user, login_user, logout_user
 from google.oauth2.credentials import Credentials
@@ -18,6 +19,9 @@ class UserDataManager(Database):
 
     current_user = None
     user_calendar_accounts = {}
+    # (user, email) -> (stored credentials, monotonic time loaded)
+    credentials_cache = {}
+    CREDENTIALS_CACHE_TTL = 60  # seconds
 
     @classmethod
     def get_current_user(cls):
@@ -30,6 +34,9 @@ class UserDataManager(Database):
         user = User(email)
         login_user(user, remember=True)
         cls.current_user = email
+        # Load the accounts up front so provider lookups and credential reads
+        # for this user are served without further queries
+        cls.load_calendar_accounts()
         logger.info(f"User {email} logged in.")
 
     @classmethod
@@ -63,11 +70,25 @@ class UserDataManager(Database):
         calendar_accounts = (
             cls._db.session.query(CalendarAccount)
             .filter_by(user_id=cls.current_user)
+            .order_by(CalendarAccount.id)
             .all()
         )
+        # Older databases can hold duplicate rows per email; like the other
+        # lookups, use the first one, which is the row saves update
+        first_accounts = {}
+        for account in calendar_accounts:
+            first_accounts.setdefault(account.email_address, account)
         cls.user_calendar_accounts = {
-            account.email_address: account.provider for account in calendar_accounts
+            email: account.provider for email, account in first_accounts.items()
         }
+        # The rows already carry the credentials, so later get_credentials
+        # calls for these accounts don't need their own SELECT
+        loaded_at = time.monotonic()
+        for email, account in first_accounts.items():
+            cls.credentials_cache[(cls.current_user, email)] = (
+                account.authentication_credentials,
+                loaded_at,
+            )
         logger.debug(f"Loaded calendar accounts: {cls.user_calendar_accounts}")
 
     @classmethod
@@ -86,17 +107,29 @@ class UserDataManager(Database):
 
     @classmethod
     def save_calendar_account(cls, email_address, provider, credentials):
-        """Save a calendar account to the database."""
+        """Save a calendar account to the database, updating it if it already exists."""
         if not cls.current_user:
             raise ValueError("Current user not set. Please log in first.")
-        calendar_account = CalendarAccount(
-            user_id=cls.current_user,
-            email_address=email_address,
-            provider=provider,
-            credentials=credentials,
+        calendar_account = (
+            cls._db.session.query(CalendarAccount)
+            .filter_by(user_id=cls.current_user, email_address=email_address)
+            .order_by(CalendarAccount.id)
+            .first()
         )
-        cls._db.session.add(calendar_account)
+        if calendar_account:
+            calendar_account.provider = provider
+            calendar_account.authentication_credentials = credentials
+        else:
+            calendar_account = CalendarAccount(
+                user_id=cls.current_user,
+                email_address=email_address,
+                provider=provider,
+                credentials=credentials,
+            )
+            cls._db.session.add(calendar_account)
         cls._db.session.commit()
+        # Only drop the cached entry once the new credentials are committed
+        cls.credentials_cache.pop((cls.current_user, email_address), None)
         logger.debug(f"Calendar account saved for {email_address}")
 
     @classmethod
@@ -113,19 +146,25 @@ class UserDataManager(Database):
         """Retrieve the credentials for the given email and provider from the database."""
         if not cls.current_user:
             raise ValueError("Current user not set. Please log in first.")
-        calendar_account = (
-            cls._db.session.query(CalendarAccount)
-            .filter_by(user_id=cls.current_user, email_address=email)
-            .first()
-        )
-        if calendar_account:
-            logger.debug(f"Credentials loaded for {email}")
-            return Credentials.from_authorized_user_info(
-                calendar_account.authentication_credentials
-            )
+        key = (cls.current_user, email)
+        cached = cls.credentials_cache.get(key)
+        if cached and time.monotonic() - cached[1] < cls.CREDENTIALS_CACHE_TTL:
+            credentials_info = cached[0]
         else:
-            logger.warning(f"Credentials not found for {email}")
-            return None
+            # Only the credentials are needed, so skip hydrating the whole account
+            row = (
+                cls._db.session.query(CalendarAccount.authentication_credentials)
+                .filter_by(user_id=cls.current_user, email_address=email)
+                .order_by(CalendarAccount.id)
+                .first()
+            )
+            if not row:
+                logger.warning(f"Credentials not found for {email}")
+                return None
+            credentials_info = row.authentication_credentials
+            cls.credentials_cache[key] = (credentials_info, time.monotonic())
+        logger.debug(f"Credentials loaded for {email}")
+        return Credentials.from_authorized_user_info(credentials_info)
 
     @staticmethod
     def create_user(email):
@@ -1,7 +1,8 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import jinja2
-from flask import Flask, current_app, render_template
+from flask import Flask, copy_current_request_context, current_app, render_template
 from flask_login import login_required
 
 from virtual_assistant.ai.openai_module import OpenAIModule
@@ -10,12 +11,14 @@ from virtual_assistant.auth.user_auth import setup_login_manager
 from virtual_assistant.database.database import Database
 from virtual_assistant.database.database_routes import database_bp
 from virtual_assistant.database.user_manager import UserDataManager
-from virtual_assistant.meetings.meetings_routes import meetings_bp, providers
+from virtual_assistant.meetings.meetings_routes import get_provider, meetings_bp
 from virtual_assistant.new_user import new_user
 from virtual_assistant.tasks.todoist_module import TodoistModule
 from virtual_assistant.utils.logger import logger
 from virtual_assistant.utils.settings import Settings
 
+MEETINGS_FETCH_WORKERS = 4
+
 
 def create_database_module():
     """Factory function to create the appropriate database module."""
@@ -51,12 +54,18 @@ def main_app():
     logger.info("Displaying meetings")
     calendar_accounts = UserDataManager.get_calendar_accounts()
     meetings = []
-    for email, provider_key in calendar_accounts.items():
-        provider_class = providers.get(provider_key)
-        if provider_class:
-            provider_instance = provider_class()
-            user_meetings = provider_instance.get_meetings(email)
-            meetings.extend(user_meetings)
+    # Each account is a separate remote API call, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=MEETINGS_FETCH_WORKERS) as executor:
+        futures = []
+        for email, provider_key in calendar_accounts.items():
+            provider_instance = get_provider(provider_key)
+            if provider_instance:
+                get_meetings = copy_current_request_context(
+                    provider_instance.get_meetings
+                )
+                futures.append(executor.submit(get_meetings, email))
+        for future in futures:
+            meetings.extend(future.result())
     return render_template("meetings.html", meetings=meetings)
 
 
@@ -133,6 +142,9 @@ def app(script_name=None, config=None):
     template_dir = os.path.join(application.root_path, "assets")
     if os.path.exists(template_dir):
         application.jinja_loader = jinja2.FileSystemLoader(template_dir)
+        # Compile the templates up front so requests only hit the cache
+        for template_name in application.jinja_env.list_templates():
+            application.jinja_env.get_template(template_name)
     else:
         logger.error(f"Template directory {template_dir} does not exist.")
 
@@ -3,21 +3,52 @@ Module for Google Calendar integration.
 """
 
 import datetime
+import functools
 import json
-import os
+import threading
 
 from flask import render_template, session
+from google.auth.exceptions import RefreshError, TransportError
 from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from virtual_assistant.database.user_manager import UserDataManager
 from virtual_assistant.meetings.calendar_provider import CalendarProvider
+from virtual_assistant.utils.http_session import http_session
 from virtual_assistant.utils.logger import logger
 from virtual_assistant.utils.settings import Settings
 
+# One lock per email so concurrent requests don't refresh the same token twice
+_refresh_locks = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _calendar_discovery_document():
+    """Read and parse the bundled Calendar API discovery document once per process."""
+    from googleapiclient.discovery_cache import get_static_doc
+
+    # build_from_document accepts the parsed dict and leaves it unchanged,
+    # so keeping it parsed saves a json.loads of ~115 KB per client
+    return json.loads(get_static_doc("calendar", "v3"))
+
+
+def build_calendar_service(credentials):
+    """
+    Build a Calendar API client without re-reading the discovery document.
+
+    Parameters:
+        credentials (Credentials): The credentials to authorize requests with.
+
+    Returns:
+        Resource: The Calendar API client.
+    """
+    # googleapiclient.discovery pulls in httplib2 and friends, so only import it
+    # once a calendar client is actually needed
+    from googleapiclient.discovery import build_from_document
+
+    return build_from_document(_calendar_discovery_document(), credentials=credentials)
+
 
 class GoogleCalendarProvider(CalendarProvider):
     """
@@ -30,6 +61,16 @@ class GoogleCalendarProvider(CalendarProvider):
         self.redirect_uri = Settings.GOOGLE_REDIRECT_URI
         self.scopes = Settings.GOOGLE_SCOPES
         self.provider_name = "google"
+        # The OAuth client config never changes, so build it once per instance
+        self.client_config = {
+            "web": {
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "redirect_uris": [self.redirect_uri],
+                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+                "token_uri": "https://oauth2.googleapis.com/token",
+            }
+        }
         logger.debug("Google Calendar Provider initialized")
         logger.debug(f"Client ID = {self.client_id}")
         logger.debug(f"Client Secret = {self.client_secret}")
@@ -54,28 +95,17 @@ class GoogleCalendarProvider(CalendarProvider):
         if credentials and credentials.expired and credentials.refresh_token:
             logger.info(f"Refreshing expired credentials for {email}")
             try:
-                credentials.refresh(Request())
-                self.store_credentials(
-                    email, credentials
-                )  # Store refreshed credentials
+                credentials = self.refresh_credentials(email, credentials)
                 logger.info(f"Credentials refreshed and stored for {email}")
                 return credentials
-            except Exception as error:
+            except (RefreshError, TransportError) as error:
                 logger.error(f"Error refreshing credentials for {email}: {error}")
                 # Handle the error, e.g., by initiating a new OAuth flow
 
         if not credentials or not credentials.valid:  # Check for valid credentials
             logger.info(f"Initiating new OAuth flow for {email}")
             flow = Flow.from_client_config(
-                {
-                    "web": {
-                        "client_id": self.client_id,
-                        "client_secret": self.client_secret,
-                        "redirect_uris": [self.redirect_uri],
-                        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                        "token_uri": "https://oauth2.googleapis.com/token",
-                    }
-                },
+                self.client_config,
                 scopes=self.scopes,
                 redirect_uri=self.redirect_uri,
             )
@@ -90,18 +120,35 @@ class GoogleCalendarProvider(CalendarProvider):
 
         return credentials, None
 
+    def refresh_credentials(self, email, credentials):
+        """
+        Refresh expired credentials, making sure only one refresh per email runs at a time.
+
+        Requests that wait on the lock reuse the credentials stored by whichever
+        request refreshed first instead of refreshing again.
+
+        Parameters:
+            email (str): The email address the credentials belong to.
+            credentials (Credentials): The expired credentials.
+
+        Returns:
+            Credentials: Valid credentials for the email.
+        """
+        lock = _refresh_locks.setdefault(email, threading.Lock())
+        with lock:
+            stored_credentials = self.get_credentials(email)
+            if stored_credentials and stored_credentials.valid:
+                logger.debug(f"Credentials for {email} already refreshed")
+                return stored_credentials
+
+            credentials.refresh(Request(session=http_session))
+            self.store_credentials(email, credentials)  # Store refreshed credentials
+            return credentials
+
     def retrieve_tokens(self, callback_url):
         state = session.get("oauth_state")
         flow = Flow.from_client_config(
-            {
-                "web": {
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "redirect_uris": [self.redirect_uri],
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                }
-            },
+            self.client_config,
             scopes=self.scopes,
             redirect_uri=self.redirect_uri,
             state=state,
@@ -115,6 +162,11 @@ class GoogleCalendarProvider(CalendarProvider):
             "client_id": credentials.client_id,
             "client_secret": credentials.client_secret,
             "scopes": credentials.scopes,
+            # Without the expiry the token always looks valid and is only
+            # refreshed after Google rejects it
+            "expiry": (
+                credentials.expiry.isoformat() + "Z" if credentials.expiry else None
+            ),
         }
 
     def get_meetings(self, email):
@@ -135,7 +187,12 @@ class GoogleCalendarProvider(CalendarProvider):
                 logger.error(f"No credentials found for {email}")
                 return []
 
-            service = build("calendar", "v3", credentials=credentials)
+            # Refresh under the per-email lock and store the result; otherwise
+            # the client refreshes in memory on every request and never saves it
+            if credentials.expired and credentials.refresh_token:
+                credentials = self.refresh_credentials(email, credentials)
+
+            service = build_calendar_service(credentials)
             logger.debug(f"Calendar service built successfully for {email}")
 
             now = datetime.datetime.utcnow().isoformat() + "Z"  # "Z" indicates UTC time
@@ -146,28 +203,22 @@ class GoogleCalendarProvider(CalendarProvider):
                     timeMin=now,
                     singleEvents=True,
                     orderBy="startTime",
+                    # Only ask for what we turn into meetings
+                    fields="items(summary,start,end)",
                 )
                 .execute()
             )
-            logger.debug(
-                f"Events retrieved for {email}: {len(events_result.get('items', []))} events"
-            )
-
             events = events_result.get("items", [])
-            logger.debug(f"Events extracted for {email}: {len(events)} events")
-
-            meetings = []
-            for event in events:
-                try:
-                    meeting = {
-                        "title": event.get("summary", ""),
-                        "start": self.get_meeting_time(event.get("start", {})),
-                        "end": self.get_meeting_time(event.get("end", {})),
-                    }
-                    meetings.append(meeting)
-                except Exception as e:
-                    logger.error(f"Error processing event: {event}")
-                    logger.exception(e)
+            logger.debug(f"Events retrieved for {email}: {len(events)} events")
+
+            meetings = [
+                {
+                    "title": event.get("summary", ""),
+                    "start": self.get_meeting_time(event.get("start", {})),
+                    "end": self.get_meeting_time(event.get("end", {})),
+                }
+                for event in events
+            ]
 
             logger.debug(f"Meetings processed for {email}: {len(meetings)} meetings")
             return meetings
@@ -195,35 +246,12 @@ class GoogleCalendarProvider(CalendarProvider):
         Returns:
             str: The meeting time in ISO format.
         """
-        try:
-            logger.debug(f"Meeting time: {meeting_time}")
-            logger.debug(f"Type of meeting_time: {type(meeting_time)}")
-
-            if isinstance(meeting_time, dict):
-                logger.debug("Meeting time is a dictionary")
-                date_time = meeting_time.get("dateTime")
-                logger.debug(f"dateTime: {date_time}")
-
-                date = meeting_time.get("date")
-                logger.debug(f"date: {date}")
-
-                if date_time:
-                    logger.debug("Returning dateTime")
-                    return date_time
-                elif date:
-                    logger.debug("Returning date")
-                    return date
-                else:
-                    logger.debug("Returning empty string")
-                    return ""
-            else:
-                logger.warning(f"Unexpected meeting time format: {meeting_time}")
-                logger.debug("Converting meeting time to string")
-                return str(meeting_time)
-        except Exception as e:
-            logger.error(f"Error getting meeting time: {meeting_time}")
-            logger.exception(e)
-            return ""
+        if isinstance(meeting_time, dict):
+            # Timed events carry dateTime, all-day events carry date
+            return meeting_time.get("dateTime") or meeting_time.get("date") or ""
+
+        logger.warning(f"Unexpected meeting time format: {meeting_time}")
+        return str(meeting_time)
 
     def create_meeting(self, email, meeting_data):
         """
@@ -238,8 +266,10 @@ class GoogleCalendarProvider(CalendarProvider):
         """
         credentials = self.get_credentials(email)
         if credentials:
+            if credentials.expired and credentials.refresh_token:
+                credentials = self.refresh_credentials(email, credentials)
             logger.info(f"Creating meeting for {email}")
-            service = build("calendar", "v3", credentials=credentials)
+            service = build_calendar_service(credentials)
             event = (
                 service.events()
                 .insert(calendarId="primary", body=meeting_data)
@@ -260,17 +290,14 @@ class GoogleCalendarProvider(CalendarProvider):
         Returns:
             Credentials object if found; None otherwise.
         """
-        logger.debug(f"Retrieving credentials for {email}")
-        user_folder = UserManager.get_user_folder()
-        provider_folder = os.path.join(user_folder, self.provider_name)
-        credentials_file = os.path.join(provider_folder, f"{email}_credentials.json")
-
-        if os.path.exists(credentials_file):
-            with open(credentials_file, "r", encoding="utf-8") as file:
-                credentials_data = json.load(file)
-                credentials = Credentials.from_authorized_user_info(credentials_data)
-                logger.debug(f"Credentials loaded for {email}")
-                return credentials
+        return UserDataManager.get_credentials(email)
 
-        logger.warning(f"Credentials file not found for {email}")
-        return None
+    def store_credentials(self, email, credentials):
+        """
+        Store the credentials for the given email address.
+
+        Parameters:
+            email (str): The email address the credentials belong to.
+            credentials (Credentials): The credentials to store.
+        """
+        UserDataManager.save_credentials(email, json.loads(credentials.to_json()))
@@ -4,6 +4,7 @@ Meetings Blueprint routes and functionality.
 
 from flask import (
     Blueprint,
+    g,
     jsonify,
     redirect,
     render_template,
@@ -25,6 +26,29 @@ providers = {
 }
 
 
+def get_provider(provider_key):
+    """
+    Get the calendar provider instance for the current request.
+
+    Providers are created on first use and kept on flask.g, so each request
+    builds at most one instance per provider and nothing is shared between
+    requests.
+
+    Args:
+        provider_key (str): The provider key, e.g. "google" or "o365".
+
+    Returns:
+        CalendarProvider: The provider instance, or None if unsupported.
+    """
+    provider_instances = g.setdefault("calendar_providers", {})
+    if provider_key not in provider_instances:
+        provider_class = providers.get(provider_key)
+        if not provider_class:
+            return None
+        provider_instances[provider_key] = provider_class()
+    return provider_instances[provider_key]
+
+
 @meetings_bp.route("/start_oauth/<provider>")
 def start_oauth(provider):
     """
@@ -38,7 +62,7 @@ def start_oauth(provider):
     """
     logger.info("Starting OAuth flow for provider: %s", provider)
     if provider == "google":
-        google_provider = GoogleCalendarProvider()
+        google_provider = get_provider("google")
         result = google_provider.authenticate(request.args.get("email"))
         if isinstance(result, tuple):
             _, authorization_url = result
@@ -63,20 +87,19 @@ def oauth_callback():
     provider_key = UserDataManager.get_provider_for_email(current_email)
     logger.debug(f"Available providers: {providers}")
     logger.debug(f"Provider key: {provider_key}")
-    provider_class = providers.get(provider_key)
+    provider_instance = get_provider(provider_key)
 
-    if not provider_class:
+    if not provider_instance:
         logger.error("Invalid provider for the current email address")
         return f"Invalid provider for {current_email}", 400
 
-    provider_instance = provider_class()
     credentials = provider_instance.retrieve_tokens(request.url)
 
     if not credentials:
         logger.error("Failed to obtain credentials from OAuth callback")
         return "Failed to obtain credentials", 500
 
-    UserManager.save_credentials(current_email, credentials)
+    UserDataManager.save_credentials(current_email, credentials)
     logger.info("New credentials stored for %s", current_email)
 
     return "Authentication successful. Credentials stored.", 200
@@ -94,7 +117,7 @@ def debug_meetings(email):
     Returns:
         Response: Rendered template with the meetings or an error message.
     """
-    google_provider = GoogleCalendarProvider()
+    google_provider = get_provider("google")
     try:
         meetings = google_provider.get_meetings(email)
         logger.info("Meetings for %s: %s", email, meetings)
@@ -3,49 +3,57 @@ import os
 import urllib.parse
 from datetime import datetime, timedelta
 
-import msal
-import requests
-
 # import secrets
 # import hashlib
 # import base64
 from flask import render_template, session
 
+from virtual_assistant.utils.http_session import http_session
 from virtual_assistant.utils.logger import logger
 
 from .calendar_provider import CalendarProvider
 
 
 class O365CalendarProvider(CalendarProvider):
+    EVENTS_ENDPOINT = "https://graph.microsoft.com/v1.0/me/events"
+    # Only the fields get_meetings turns into meetings
+    EVENT_FIELDS = "subject,start,end"
+    # Graph pages events 10 at a time by default
+    EVENTS_PAGE_SIZE = 999
+
     def __init__(self):
+        # msal is only needed once an O365 provider is used, so don't pay for
+        # importing it when the module is loaded
+        import msal
+
         self.client_id = os.environ["MICROSOFT_CLIENT_ID"]
         self.client_secret = os.environ["MICROSOFT_CLIENT_SECRET"]
         self.redirect_uri = "https://virtualassistant-lakeland.pythonanywhere.com/meetings/o365_authenticate"
         self.scopes = ["Calendars.ReadWrite"]
         self.authority = "https://login.microsoftonline.com/common"
+        # Each provider keeps its own client and token cache; a cache shared
+        # across the process would let any user pick up another user's tokens
+        # by naming their email
         self.app = msal.ConfidentialClientApplication(
             self.client_id,
             authority=self.authority,
             client_credential=self.client_secret,
+            http_client=http_session,
         )
 
     def authenticate(self, email):
-        cache = msal.SerializableTokenCache()
-        app = msal.ConfidentialClientApplication(
-            self.client_id,
-            authority=self.authority,
-            client_credential=self.client_secret,
-            token_cache=cache,
-        )
-
-        accounts = app.get_accounts(username=email)
+        # Reuse the client built in __init__; constructing another one repeats
+        # MSAL's authority discovery request
+        accounts = self.app.get_accounts(username=email)
         if accounts:
-            result = app.acquire_token_silent(scopes=self.scopes, account=accounts[0])
-            if "access_token" in result:
+            result = self.app.acquire_token_silent(
+                scopes=self.scopes, account=accounts[0]
+            )
+            if result and "access_token" in result:
                 return result["access_token"], None
 
         # Initiate the auth code flow
-        flow = app.initiate_auth_code_flow(
+        flow = self.app.initiate_auth_code_flow(
             scopes=self.scopes, redirect_uri=self.redirect_uri
         )
         session["flow"] = flow
@@ -113,7 +121,6 @@ class O365CalendarProvider(CalendarProvider):
             return None
 
     def get_meetings(self, email, access_token):
-        endpoint = "https://graph.microsoft.com/v1.0/me/events"
         headers = {
             "Authorization": f"Bearer {access_token}",
             "Prefer": 'outlook.timezone="UTC"',
@@ -124,31 +131,33 @@ class O365CalendarProvider(CalendarProvider):
         end_date = (now + timedelta(days=7)).strftime("%Y-%m-%dT00:00:00Z")
 
         params = {
-            "$select": "subject,start,end",
+            "$select": self.EVENT_FIELDS,
+            "$top": self.EVENTS_PAGE_SIZE,
             "$filter": f"start/dateTime ge '{start_date}' and end/dateTime le '{end_date}'",
         }
 
-        events_result = requests.get(endpoint, headers=headers, params=params).json()
+        events_result = http_session.get(
+            self.EVENTS_ENDPOINT, headers=headers, params=params
+        ).json()
 
-        meetings = []
-        for event in events_result["value"]:
-            meeting = {
+        return [
+            {
                 "title": event["subject"],
                 "start": event["start"]["dateTime"],
                 "end": event["end"]["dateTime"],
             }
-            meetings.append(meeting)
-
-        return meetings
+            for event in events_result["value"]
+        ]
 
     def create_meeting(self, email, access_token, event_data):
-        endpoint = "https://graph.microsoft.com/v1.0/me/events"
         headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
         }
 
-        response = requests.post(endpoint, headers=headers, json=event_data)
+        response = http_session.post(
+            self.EVENTS_ENDPOINT, headers=headers, json=event_data
+        )
         if response.status_code == 201:
             return True
         else:
@@ -2,7 +2,7 @@ from flask import redirect, session, url_for
 from flask_login import current_user
 
 from virtual_assistant.database.user_manager import UserDataManager
-from virtual_assistant.meetings.meetings_routes import providers
+from virtual_assistant.meetings.meetings_routes import get_provider
 from virtual_assistant.utils.logger import logger
 
 
@@ -34,15 +34,14 @@ def new_user():
 
     for email, provider_key in user_calendar_accounts.items():
         session["current_email"] = email
-        provider_class = providers.get(provider_key)
+        provider_instance = get_provider(provider_key)
 
-        if not provider_class:
+        if not provider_instance:
             logger.error(f"Unsupported provider {provider_key} for {email}")
             continue
 
         logger.info(f"Attempting setup for provider: {provider_key}, email: {email}")
 
-        provider_instance = provider_class()
         credentials = UserDataManager.get_credentials(email)
 
         if credentials is None:
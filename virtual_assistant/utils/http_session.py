@@ -0,0 +1,8 @@
+# utils/http_session.py
+import requests
+from requests.adapters import HTTPAdapter
+
+# Shared session so calls to the same API host reuse keep-alive connections
+# instead of paying a TCP and TLS handshake every time
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
@@ -12,6 +12,11 @@ class Settings:
     PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     USERS_FOLDER = os.path.join(PROJECT_ROOT, "users")
     DATABASE_URI = "sqlite:///users/database.db"
+    # journal_mode is stored in the database file and WAL needs shared memory
+    # on one host, so only switch it where the file is on local disk.
+    # synchronous=NORMAL is only corruption-safe with WAL, so pair them.
+    SQLITE_JOURNAL_MODE = os.environ.get("SQLITE_JOURNAL_MODE")
+    SQLITE_SYNCHRONOUS = os.environ.get("SQLITE_SYNCHRONOUS")
 
     # Google API credentials
     GOOGLE_CLIENT_ID = os.environ.get("GOOGLE_CLIENT_ID")